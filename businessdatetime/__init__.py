@@ -1,5 +1,421 @@
+from bisect import bisect_left
 from datetime import datetime, timedelta
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy is only needed for the array based helpers
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the day counting helpers run as plain python
+    njit = None
+
+# Microseconds in a day
+_DAY = 86400000000
+
+# datetime(1970, 1, 1).toordinal()
+_EPOCH_ORDINAL = 719163
+
+_NP_ONE_DAY = None if np is None else np.timedelta64(1, 'D')
+
+# Maximum number of distinct configurations and calendar days kept by the caches below
+_CONFIG_CACHE_SIZE = 32
+_DAY_BOUNDS_CACHE_SIZE = 1024
+
+
+def _jit(func):
+    """
+    Compile func to machine code with numba when it is available.
+    """
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
+
+
+def _epoch_microseconds(dt):
+    """
+    Return the number of microseconds between the unix epoch and a naive datetime object.
+    :param dt: datetime object
+    :rtype: int
+    :return:
+    """
+    if dt.tzinfo is not None:
+        raise TypeError('offset-aware datetimes are not supported')
+    return ((dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second) * 1000000 + \
+        dt.microsecond
+
+
+@_jit
+def _rollforward(dt, start, end, working_mask):
+    """
+    Return the timestamp moved to the next working day, offset from its start by the amount of time that the
+    timestamp exceeds the end of its own working day.
+    :param dt: timestamp in microseconds since the epoch
+    :param start: start of the working day in microseconds since midnight
+    :param end: end of the working day in microseconds since midnight
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :return:
+    """
+    day = dt // _DAY
+    next_day = day + 1
+    # The epoch fell on a thursday
+    while not (working_mask >> ((next_day + 3) % 7)) & 1:
+        next_day += 1
+    return next_day * _DAY + start + dt - (day * _DAY + end)
+
+
+@_jit
+def _rollback(dt, start, end, working_mask):
+    """
+    Return the timestamp moved to the previous working day, offset from its end by the amount of time that the
+    timestamp falls short of the start of its own working day.
+    :param dt: timestamp in microseconds since the epoch
+    :param start: start of the working day in microseconds since midnight
+    :param end: end of the working day in microseconds since midnight
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :return:
+    """
+    day = dt // _DAY
+    previous_day = day - 1
+    # The epoch fell on a thursday
+    while not (working_mask >> ((previous_day + 3) % 7)) & 1:
+        previous_day -= 1
+    return previous_day * _DAY + end - (day * _DAY + start - dt)
+
+
+@_jit
+def _to_business(dt, start, end, working_mask):
+    """
+    Return the business timestamp for a timestamp, rolling it into working hours when it falls outside of them.
+    :param dt: timestamp in microseconds since the epoch
+    :param start: start of the working day in microseconds since midnight
+    :param end: end of the working day in microseconds since midnight
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :return:
+    """
+    time = dt % _DAY
+    if time > end:
+        return _rollforward(dt, start, end, working_mask)
+    elif time < start:
+        return _rollback(dt, start, end, working_mask)
+    return dt
+
+
+@_jit
+def _bizdiff(lo, hi, start, end, working_mask, lo_holiday, hi_holiday):
+    """
+    Return the amount of business time in microseconds between two timestamps, not counting holidays between them.
+    :param lo: lesser timestamp in microseconds since the epoch
+    :param hi: greater timestamp in microseconds since the epoch
+    :param start: start of the working day in microseconds since midnight
+    :param end: end of the working day in microseconds since midnight
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :param lo_holiday: whether the day of the lesser timestamp is a holiday
+    :param hi_holiday: whether the day of the greater timestamp is a holiday
+    :return:
+    """
+    lo_day = lo // _DAY
+    hi_day = hi // _DAY
+    # The epoch fell on a thursday
+    lo_working = (working_mask >> ((lo_day + 3) % 7)) & 1
+    if lo_holiday:
+        lo_working = 0
+    if lo_day == hi_day:
+        if lo_working:
+            return hi - lo
+        return 0
+    hi_working = (working_mask >> ((hi_day + 3) % 7)) & 1
+    if hi_holiday:
+        hi_working = 0
+    working_days_per_week = 0
+    for weekday in range(7):
+        working_days_per_week += (working_mask >> weekday) & 1
+    # Working days strictly between the two timestamps
+    full_weeks, rem = divmod(hi_day - lo_day - 1, 7)
+    number_of_working_days = full_weeks * working_days_per_week
+    for day in range(hi_day - rem, hi_day):
+        if (working_mask >> ((day + 3) % 7)) & 1:
+            number_of_working_days += 1
+    business_time = number_of_working_days * (end - start)
+    # The remaining and passed time only count on working days
+    if lo_working:
+        business_time += lo_day * _DAY + end - lo
+    if hi_working:
+        business_time += hi - hi_day * _DAY - start
+    return business_time
+
+
+def _business_microseconds(lo, hi, start, end, working_mask, holiday_days):
+    """
+    Return the amount of business time in microseconds between two timestamps, excluding holidays.
+    :param lo: lesser timestamp in microseconds since the epoch
+    :param hi: greater timestamp in microseconds since the epoch
+    :param start: start of the working day in microseconds since midnight
+    :param end: end of the working day in microseconds since midnight
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :param holiday_days: sorted list of holidays which fall on working days in days since the epoch
+    :return:
+    """
+    if not holiday_days:
+        return _bizdiff(lo, hi, start, end, working_mask, False, False)
+    lo_day = lo // _DAY
+    hi_day = hi // _DAY
+    lo_index = bisect_left(holiday_days, lo_day)
+    hi_index = bisect_left(holiday_days, hi_day)
+    lo_holiday = lo_index < len(holiday_days) and holiday_days[lo_index] == lo_day
+    hi_holiday = hi_index < len(holiday_days) and holiday_days[hi_index] == hi_day
+    business_time = _bizdiff(lo, hi, start, end, working_mask, lo_holiday, hi_holiday)
+    if lo_day == hi_day:
+        return business_time
+    # Holidays strictly between the two timestamps
+    holidays_between = hi_index - lo_index - lo_holiday
+    return business_time - holidays_between * (end - start)
+
+
+def _get_holiday_days(holidays, working_mask):
+    """
+    Return a sorted list of the holidays which fall on working days in days since the epoch.
+    :param holidays: iterable of date, datetime or numpy datetime64 objects
+    :param working_mask: bit mask of the working days where bit 0 = Monday, bit 6 = Sunday
+    :rtype: list
+    :return:
+    """
+    holiday_days = set()
+    for holiday in holidays if holidays is not None else ():
+        if np is not None and isinstance(holiday, np.datetime64):
+            if np.isnat(holiday):
+                continue
+            day = int(holiday.astype('datetime64[D]').astype('int64'))
+        else:
+            day = holiday.toordinal() - _EPOCH_ORDINAL
+        # The epoch fell on a thursday
+        if (working_mask >> ((day + 3) % 7)) & 1:
+            holiday_days.add(day)
+    return sorted(holiday_days)
+
+
+def _holidays_key(holidays):
+    """
+    Return the config cache key of a holidays container. Lists, tuples and sets are keyed by value, anything else
+    such as a numpy array is keyed by identity since hashing its contents would cost as much as building the config.
+    :param holidays: iterable of date, datetime or numpy datetime64 objects
+    :return:
+    """
+    if holidays is None:
+        return None
+    elif isinstance(holidays, (list, tuple)):
+        return tuple(holidays)
+    elif isinstance(holidays, (set, frozenset)):
+        return frozenset(holidays)
+    return id(holidays)
+
+
+def _rollforward_array(dts, days, config):
+    """
+    Return the datetime64[us] array dts rolled forward into the next working day.
+    :param dts: numpy array of datetime64[us]
+    :param days: dts as datetime64[D]
+    :param config: _Config
+    :rtype: numpy.ndarray
+    :return:
+    """
+    overflow = dts - (days + config.end_td64)
+    next_days = np.busday_offset(days + _NP_ONE_DAY, 0, roll='forward', weekmask=config.weekmask,
+                                 holidays=config.holiday_array)
+    return next_days + config.start_td64 + overflow
+
+
+def _rollback_array(dts, days, config):
+    """
+    Return the datetime64[us] array dts rolled back into the previous working day.
+    :param dts: numpy array of datetime64[us]
+    :param days: dts as datetime64[D]
+    :param config: _Config
+    :rtype: numpy.ndarray
+    :return:
+    """
+    underflow = (days + config.start_td64) - dts
+    previous_days = np.busday_offset(days - _NP_ONE_DAY, 0, roll='backward', weekmask=config.weekmask,
+                                     holidays=config.holiday_array)
+    return previous_days + config.end_td64 - underflow
+
+
+class _Config(object):
+    """
+    Working hours, working days and holidays along with everything derived from them. Shared between every
+    BusinessDatetime and BusinessDatetimeCalculator built with the same arguments.
+    """
+    __slots__ = ('holidays', 'working_hours', 'start_working_hour', 'start_working_minute', 'end_working_hour',
+                 'end_working_minute', 'working_days', 'working_mask', 'holiday_days', 'holiday_array', 'weekmask',
+                 'next_offset', 'prev_offset', 'start_td', 'end_td', 'start_td64', 'end_td64', 'workday_td64', 'start',
+                 'end', 'seconds_in_workday', '_day_bounds', 'holiday_ordinals')
+
+    def __init__(self, working_hours, working_days, holidays):
+        # Holding on to holidays also keeps the id of the ones keyed by identity from being reused
+        self.holidays = holidays
+        self.working_hours = start_working_hour, end_working_hour = working_hours
+        self.start_working_hour, self.start_working_minute = divmod(start_working_hour * 60, 60)
+        self.start_working_hour = int(self.start_working_hour)
+        self.start_working_minute = int(self.start_working_minute)
+        self.end_working_hour, self.end_working_minute = divmod(end_working_hour * 60, 60)
+        self.end_working_hour = int(self.end_working_hour)
+        self.end_working_minute = int(self.end_working_minute)
+        self.working_days = working_days
+        # Bit mask of the working days, so a weekday is tested with (working_mask >> weekday) & 1
+        working_mask = 0
+        for weekday in working_days:
+            if weekday not in (0, 1, 2, 3, 4, 5, 6):
+                raise ValueError('working_days must be weekdays between 0 (Monday) and 6 (Sunday), got %r' % (weekday,))
+            working_mask |= 1 << weekday
+        if not working_mask:
+            raise ValueError('working_days must contain at least one day of the week')
+        self.working_mask = working_mask
+        self.holiday_days = _get_holiday_days(holidays, working_mask)
+        # The same holidays as datetime ordinals for skipping them when rolling to another working day
+        self.holiday_ordinals = frozenset(day + _EPOCH_ORDINAL for day in self.holiday_days)
+        # The same holidays as a sorted numpy array for the array based helpers
+        self.holiday_array = None if np is None else np.array(self.holiday_days, dtype='datetime64[D]')
+        # numpy style weekmask. ex: (0, 1, 2, 3, 4) = '1111100'
+        self.weekmask = ''.join('1' if (working_mask >> i) & 1 else '0' for i in range(7))
+
+        # Days from each weekday to the next and previous working days
+        next_offset = [0] * 7
+        prev_offset = [0] * 7
+        for weekday in range(7):
+            for i in range(7, 0, -1):
+                if (working_mask >> ((weekday + i) % 7)) & 1:
+                    next_offset[weekday] = i
+                if (working_mask >> ((weekday - i) % 7)) & 1:
+                    prev_offset[weekday] = i
+        self.next_offset = [timedelta(days=days) for days in next_offset]
+        self.prev_offset = [timedelta(days=days) for days in prev_offset]
+
+        # Offsets of the start and end working hours from midnight
+        self.start_td = timedelta(hours=self.start_working_hour, minutes=self.start_working_minute)
+        self.end_td = timedelta(hours=self.end_working_hour, minutes=self.end_working_minute)
+        # The same offsets in microseconds
+        self.start = (self.start_working_hour * 60 + self.start_working_minute) * 60000000
+        self.end = (self.end_working_hour * 60 + self.end_working_minute) * 60000000
+        self.seconds_in_workday = (self.end - self.start) // 1000000
+        # The same offsets for the array based helpers
+        self.start_td64 = None if np is None else np.timedelta64(self.start, 'us')
+        self.end_td64 = None if np is None else np.timedelta64(self.end, 'us')
+        self.workday_td64 = None if np is None else np.timedelta64(self.end - self.start, 'us')
+
+        self._day_bounds = {}
+
+    def day_bounds(self, dt):
+        """
+        Return the start and the end of the working day supplied by the dt param along with its weekday.
+        :param dt: datetime object
+        :rtype: tuple
+        :return:
+        """
+        ordinal = dt.toordinal()
+        bounds = self._day_bounds.get(ordinal)
+        if bounds is None:
+            if len(self._day_bounds) >= _DAY_BOUNDS_CACHE_SIZE:
+                self._day_bounds.clear()
+            base_date = datetime.fromordinal(ordinal)
+            # Ordinal 1 (0001-01-01) was a monday
+            bounds = self._day_bounds[ordinal] = (base_date + self.start_td, base_date + self.end_td, (ordinal - 1) % 7)
+        return bounds
+
+
+_configs = {}
+
+
+def _get_config(working_hours, working_days, holidays):
+    """
+    Return the cached _Config for the arguments, building it on first use. Numpy arrays of holidays are keyed by
+    identity, so an array changed in place after use isn't noticed.
+    :rtype: _Config
+    :return:
+    """
+    key = tuple(working_hours), tuple(working_days), _holidays_key(holidays)
+    config = _configs.get(key)
+    if config is None:
+        if len(_configs) >= _CONFIG_CACHE_SIZE:
+            _configs.clear()
+        # Copied so later changes to the caller's container don't leak into the shared config
+        if isinstance(holidays, list):
+            holidays = list(holidays)
+        elif isinstance(holidays, set):
+            holidays = set(holidays)
+        config = _configs[key] = _Config(working_hours, working_days, holidays)
+    return config
+
+
+def _config_attribute(name):
+    """
+    Return a read only property exposing the attribute name of the instance's _Config.
+    """
+    return property(lambda self: getattr(self._config, name))
+
+
+# Source of the subclasses built by BusinessDatetime.specialize. The working day bounds and mask are substituted
+# as literals and the remaining tables are looked up as globals of the generated class.
+_SPECIALIZED_SOURCE = """
+class SpecializedBusinessDatetime(base):
+    __slots__ = ()
+
+    def __init__(self, dt):
+        self.original_datetime = dt
+        self._business_datetime = None
+        self._config = config
+        self.current_work_day_start, self.current_work_day_end, self._weekday = day_bounds(dt)
+
+    @property
+    def next_business_day_start(self):
+        d = self.current_work_day_start + next_offset[self._weekday]
+        if holiday_ordinals:
+            ordinal = d.toordinal()
+            while ordinal in holiday_ordinals:
+                d += next_offset[(ordinal - 1) %% 7]
+                ordinal = d.toordinal()
+        return d
+
+    @property
+    def previous_business_day_end(self):
+        d = self.current_work_day_end - prev_offset[self._weekday]
+        if holiday_ordinals:
+            ordinal = d.toordinal()
+            while ordinal in holiday_ordinals:
+                d -= prev_offset[(ordinal - 1) %% 7]
+                ordinal = d.toordinal()
+        return d
+
+    def __reduce__(self):
+        return _make_specialized, (base, config.working_hours, config.working_days, config.holidays,
+                                   self.original_datetime)
+
+    def _epoch_business_datetime(self):
+        if self._business_datetime is not None or holiday_days:
+            return _epoch_microseconds(self.business_datetime)
+        return _to_business(_epoch_microseconds(self.original_datetime), %(start)d, %(end)d, %(working_mask)d)
+
+    def calc_diff(self, other):
+        lesser_date = other._epoch_business_datetime()
+        greater_date = self._epoch_business_datetime()
+        if lesser_date > greater_date:
+            return -timedelta(microseconds=_business_microseconds(greater_date, lesser_date, %(start)d, %(end)d,
+                                                                  %(working_mask)d, holiday_days))
+        return timedelta(microseconds=_business_microseconds(lesser_date, greater_date, %(start)d, %(end)d,
+                                                             %(working_mask)d, holiday_days))
+"""
+
+_specialized_classes = {}
+
+
+def _make_specialized(base, working_hours, working_days, holidays, dt):
+    """
+    Rebuild an instance of a class generated by BusinessDatetime.specialize when unpickling.
+    """
+    return base.specialize(working_hours, working_days, holidays)(dt)
+
 
 class BusinessDatetime(object):
     """
@@ -14,6 +430,16 @@ class BusinessDatetime(object):
     >>> print bdt  # Outputs 2016-06-05 16:30:00
 
     """
+    __slots__ = ('original_datetime', '_config', '_weekday', 'current_work_day_end',
+                 'current_work_day_start', '_business_datetime')
+
+    holidays = _config_attribute('holidays')
+    working_hours = _config_attribute('working_hours')
+    start_working_hour = _config_attribute('start_working_hour')
+    start_working_minute = _config_attribute('start_working_minute')
+    end_working_hour = _config_attribute('end_working_hour')
+    end_working_minute = _config_attribute('end_working_minute')
+    working_days = _config_attribute('working_days')
 
     def __init__(self, dt, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
         """
@@ -21,37 +447,89 @@ class BusinessDatetime(object):
         :param dt: datetime object
         :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
         :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
-        :param holidays: A list of datetime objects representing holidays (not implemented)
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
         """
+        self._setup(dt, _get_config(working_hours, working_days, holidays))
+
+    def _setup(self, dt, config):
         self.original_datetime = dt
-        self.holidays = holidays
-        self.working_hours = self._start_working_hour, self._end_working_hour = working_hours
-        self.start_working_hour, self.start_working_minute = divmod(self._start_working_hour * 60, 60)
-        self.start_working_hour = int(self.start_working_hour)
-        self.start_working_minute = int(self.start_working_minute)
-        self.end_working_hour, self.end_working_minute = divmod(self._end_working_hour * 60, 60)
-        self.end_working_hour = int(self.end_working_hour)
-        self.end_working_minute = int(self.end_working_minute)
-        self.working_days = working_days
+        self._business_datetime = None
+        self._config = config
 
-        # The end of the current working day supplied by the dt param
-        self.current_work_day_end = datetime(dt.year, dt.month, dt.day, self.end_working_hour, self.end_working_minute)
+        # The beginning and the end of the current working day supplied by the dt param and its weekday
+        self.current_work_day_start, self.current_work_day_end, self._weekday = config.day_bounds(dt)
 
-        # The beginning of the current working day supplied by the dt param
-        self.current_work_day_start = datetime(dt.year, dt.month, dt.day, self.start_working_hour,
-                                               self.start_working_minute)
+    def __reduce__(self):
+        return self.__class__, (self.original_datetime, self.working_hours, self.working_days, self.holidays)
+
+    def _wrap(self, dt):
+        """
+        Return an instance of the same class for dt sharing the configuration of this object.
+        :param dt: datetime object
+        :rtype: BusinessDatetime
+        :return:
+        """
+        cls = type(self)
+        bdt = cls.__new__(cls)
+        bdt._setup(dt, self._config)
+        return bdt
+
+    @classmethod
+    def specialize(cls, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
+        """
+        Return a subclass with the working hours, working days and holidays baked in, for when many datetimes
+        are wrapped with the same settings. The subclass is generated once per distinct set of arguments.
+
+        ex:
+            >>> NineToFive = BusinessDatetime.specialize(working_hours=(9, 17))
+            >>> print NineToFive(datetime(2016, 6, 6, 8, 30))
+            2016-06-03 16:30:00
+        :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
+        :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
+        :rtype: type
+        :return:
+        """
+        config = _get_config(working_hours, working_days, holidays)
+        key = cls, config
+        specialized = _specialized_classes.get(key)
+        if specialized is None:
+            # Bounded like the config cache, since every class holds on to its config
+            if len(_specialized_classes) >= _CONFIG_CACHE_SIZE:
+                _specialized_classes.clear()
+            namespace = {
+                '__name__': __name__,
+                'base': cls,
+                'config': config,
+                'day_bounds': config.day_bounds,
+                'next_offset': tuple(config.next_offset),
+                'prev_offset': tuple(config.prev_offset),
+                'holiday_days': config.holiday_days,
+                'holiday_ordinals': config.holiday_ordinals,
+                'timedelta': timedelta,
+                '_epoch_microseconds': _epoch_microseconds,
+                '_business_microseconds': _business_microseconds,
+                '_to_business': _to_business,
+                '_make_specialized': _make_specialized,
+            }
+            exec(_SPECIALIZED_SOURCE % {'start': config.start, 'end': config.end,
+                                        'working_mask': config.working_mask}, namespace)
+            specialized = _specialized_classes[key] = namespace['SpecializedBusinessDatetime']
+        return specialized
 
     def __str__(self):
-        return str(self.business_datetime)
+        return self.business_datetime.isoformat(' ')
 
     def __repr__(self):
         return repr(self.business_datetime)
 
     def __sub__(self, other):
         if isinstance(other, timedelta):
-            return BusinessDatetime(self.business_datetime - other)
+            return self._wrap(self.business_datetime - other)
         elif isinstance(other, datetime):
-            other = BusinessDatetime(other)
+            other = self._wrap(other)
         elif isinstance(other, BusinessDatetime):
             pass
         else:
@@ -60,43 +538,55 @@ class BusinessDatetime(object):
         return self.calc_diff(other)
 
     def calc_diff(self, other):
-        lesser_time_total_seconds = other.remaining_time().total_seconds()
-        greater_time_total_seconds = self.passed_time().total_seconds()
-        seconds_in_workday = (self.current_work_day_end - self.current_work_day_start).total_seconds()
-        day_difference = 0
-        dont_count_days = 0
-        d = other.business_datetime
-        while d.day != self.business_datetime.day:
-            d += timedelta(days=1)
-            # ToDo: Check if weekday is in holidays and increment dont_count_days
-            if d.weekday() not in self.working_days:
-                dont_count_days += 1
-            day_difference += 1
-        number_of_non_working_days = day_difference - 1 - dont_count_days
-        non_working_days_seconds = number_of_non_working_days * seconds_in_workday
-        working_days_seconds = lesser_time_total_seconds + greater_time_total_seconds
-        total_seconds_between_time_stamps = working_days_seconds + non_working_days_seconds
-        return timedelta(seconds=total_seconds_between_time_stamps)
+        lesser_date = other._epoch_business_datetime()
+        greater_date = self._epoch_business_datetime()
+        config = self._config
+        if lesser_date > greater_date:
+            return -timedelta(microseconds=_business_microseconds(greater_date, lesser_date, config.start, config.end,
+                                                                  config.working_mask, config.holiday_days))
+        return timedelta(microseconds=_business_microseconds(lesser_date, greater_date, config.start, config.end,
+                                                             config.working_mask, config.holiday_days))
+
+    def _epoch_business_datetime(self):
+        """
+        Return the business datetime for the original timestamp in microseconds since the epoch. Reads the cached
+        business_datetime when it has been computed or when there are holidays to skip. Otherwise the int kernels
+        roll the timestamp without building a datetime, as a fast path for configs without holidays. Their result
+        isn't stored in the business_datetime cache, so a later business_datetime or str() rolls the timestamp again.
+        :rtype: int
+        :return:
+        """
+        config = self._config
+        if self._business_datetime is not None or config.holiday_days:
+            # The int kernels don't know about holidays, so rolls past them go through business_datetime
+            return _epoch_microseconds(self.business_datetime)
+        return _to_business(_epoch_microseconds(self.original_datetime), config.start, config.end, config.working_mask)
 
     def out_of_bounds(self):
         """
         Return whether or not the original timestamp is out of valid working hours.
         :return:
         """
-        return self.original_datetime > self.current_work_day_end or self.original_datetime < self.current_work_day_start
+        dt = self.original_datetime
+        return dt > self.current_work_day_end or dt < self.current_work_day_start
 
     @property
     def business_datetime(self):
         """
-        Return the business datetime for the original timestamp.
+        Return the business datetime for the original timestamp. Computed on first access.
         :return:
         """
-        if self.original_datetime > self.current_work_day_end:
-            return self.rollforward()
-        elif self.original_datetime < self.current_work_day_start:
-            return self.rollback()
-        else:
-            return self.original_datetime
+        business_datetime = self._business_datetime
+        if business_datetime is None:
+            dt = self.original_datetime
+            if dt > self.current_work_day_end:
+                business_datetime = self.rollforward()
+            elif dt < self.current_work_day_start:
+                business_datetime = self.rollback()
+            else:
+                business_datetime = dt
+            self._business_datetime = business_datetime
+        return business_datetime
 
     @property
     def next_business_day_start(self):
@@ -105,10 +595,14 @@ class BusinessDatetime(object):
         :rtype: datetime
         :return:
         """
-        d = datetime(self.original_datetime.year, self.original_datetime.month, self.original_datetime.day,
-                     self.start_working_hour, self.start_working_minute) + timedelta(days=1)
-        while d.weekday() not in self.working_days:
-            d += timedelta(days=1)
+        config = self._config
+        d = self.current_work_day_start + config.next_offset[self._weekday]
+        if config.holiday_ordinals:
+            ordinal = d.toordinal()
+            while ordinal in config.holiday_ordinals:
+                # Ordinal 1 (0001-01-01) was a monday
+                d += config.next_offset[(ordinal - 1) % 7]
+                ordinal = d.toordinal()
         return d
 
     @property
@@ -118,10 +612,14 @@ class BusinessDatetime(object):
         :rtype: datetime
         :return:
         """
-        d = datetime(self.original_datetime.year, self.original_datetime.month, self.original_datetime.day,
-                     self.end_working_hour, self.end_working_minute) - timedelta(days=1)
-        while d.weekday() not in self.working_days:
-            d -= timedelta(days=1)
+        config = self._config
+        d = self.current_work_day_end - config.prev_offset[self._weekday]
+        if config.holiday_ordinals:
+            ordinal = d.toordinal()
+            while ordinal in config.holiday_ordinals:
+                # Ordinal 1 (0001-01-01) was a monday
+                d -= config.prev_offset[(ordinal - 1) % 7]
+                ordinal = d.toordinal()
         return d
 
     def remaining_time(self):
@@ -151,9 +649,7 @@ class BusinessDatetime(object):
             2016-06-06 8:30:30
         :return:
         """
-        overflow = datetime(self.original_datetime.year, self.original_datetime.month, self.original_datetime.day,
-                            self.end_working_hour, self.end_working_minute)
-        td = self.original_datetime - overflow
+        td = self.original_datetime - self.current_work_day_end
         return self.next_business_day_start + td
 
     def rollback(self):
@@ -169,39 +665,87 @@ class BusinessDatetime(object):
             2016-06-04 16:59:00
         :return:
         """
-        underflow = datetime(self.original_datetime.year, self.original_datetime.month, self.original_datetime.day,
-                             self.start_working_hour, self.start_working_minute)
-        td = underflow - self.original_datetime
+        td = self.current_work_day_start - self.original_datetime
         return self.previous_business_day_end - td
 
+    @classmethod
+    def rollforward_array(cls, dts, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
+        """
+        Return an array of datetime64 objects equal to calling rollforward on every timestamp in an array, without
+        building a BusinessDatetime per timestamp.
+
+        ex.
+            >>> BusinessDatetime.rollforward_array(np.array(['2016-06-03T17:00:30'], dtype='datetime64[s]'))
+            array(['2016-06-06T08:30:30.000000'], dtype='datetime64[us]')
+        :param dts: numpy array of datetime64
+        :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
+        :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
+        :rtype: numpy.ndarray
+        :return:
+        """
+        if np is None:
+            raise ImportError('numpy is required for rollforward_array')
+        dts = np.asarray(dts, dtype='datetime64[us]')
+        return _rollforward_array(dts, dts.astype('datetime64[D]'), _get_config(working_hours, working_days, holidays))
+
+    @classmethod
+    def rollback_array(cls, dts, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
+        """
+        Return an array of datetime64 objects equal to calling rollback on every timestamp in an array, without
+        building a BusinessDatetime per timestamp.
+
+        ex.
+            >>> BusinessDatetime.rollback_array(np.array(['2016-06-06T08:29'], dtype='datetime64[s]'))
+            array(['2016-06-03T16:59:00.000000'], dtype='datetime64[us]')
+        :param dts: numpy array of datetime64
+        :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
+        :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
+        :rtype: numpy.ndarray
+        :return:
+        """
+        if np is None:
+            raise ImportError('numpy is required for rollback_array')
+        dts = np.asarray(dts, dtype='datetime64[us]')
+        return _rollback_array(dts, dts.astype('datetime64[D]'), _get_config(working_hours, working_days, holidays))
+
 
 class BusinessDatetimeCalculator(object):
+    __slots__ = ('_config',)
+
+    holidays = _config_attribute('holidays')
+    working_hours = _config_attribute('working_hours')
+    start_working_hour = _config_attribute('start_working_hour')
+    start_working_minute = _config_attribute('start_working_minute')
+    end_working_hour = _config_attribute('end_working_hour')
+    end_working_minute = _config_attribute('end_working_minute')
+    working_days = _config_attribute('working_days')
+    weekmask = _config_attribute('weekmask')
+
     def __init__(self, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
         """
 
         :param dt: datetime object
         :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
         :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
-        :param holidays: A list of datetime objects representing holidays (not implemented)
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
         """
-        self.holidays = holidays
-        self.working_hours = self._start_working_hour, self._end_working_hour = working_hours
-        self.start_working_hour, self.start_working_minute = divmod(self._start_working_hour * 60, 60)
-        self.start_working_hour = int(self.start_working_hour)
-        self.start_working_minute = int(self.start_working_minute)
-        self.end_working_hour, self.end_working_minute = divmod(self._end_working_hour * 60, 60)
-        self.end_working_hour = int(self.end_working_hour)
-        self.end_working_minute = int(self.end_working_minute)
-        self.working_days = working_days
+        self._config = _get_config(working_hours, working_days, holidays)
+
+    def __reduce__(self):
+        return self.__class__, (self.working_hours, self.working_days, self.holidays)
 
     def get_work_day_end(self, dt):
         # The end of the current working day supplied by the dt param
-        return datetime(dt.year, dt.month, dt.day, self.end_working_hour, self.end_working_minute)
+        return self._config.day_bounds(dt)[1]
 
     def get_work_day_start(self, dt):
         # The beginning of the current working day supplied by the dt param
-        return datetime(dt.year, dt.month, dt.day, self.start_working_hour,
-                        self.start_working_minute)
+        return self._config.day_bounds(dt)[0]
 
     def remaining_time(self, dt):
         """
@@ -224,25 +768,61 @@ class BusinessDatetimeCalculator(object):
         :param d2:
         :return:
         """
-        lesser_date = min(d1, d2)
-        greater_date = max(d1, d2)
-        lesser_time_total_seconds = self.remaining_time(lesser_date).total_seconds()
-        greater_time_total_seconds = self.passed_time(greater_date).total_seconds()
-        seconds_in_workday = ((self.end_working_hour*60 + self.end_working_minute)*60) - ((self.start_working_hour*60 + self.start_working_minute)*60)
-        day_difference = 0
-        dont_count_days = 0
-        d = lesser_date
-        while d.day != greater_date.day:
-            d += timedelta(days=1)
-            # ToDo: Check if weekday is in holidays and increment dont_count_days
-            if d.weekday() not in self.working_days:
-                dont_count_days += 1
-            day_difference += 1
-        number_of_non_working_days = day_difference - 1 - dont_count_days
-        non_working_days_seconds = number_of_non_working_days * seconds_in_workday
-        working_days_seconds = lesser_time_total_seconds + greater_time_total_seconds
-        total_seconds_between_time_stamps = working_days_seconds + non_working_days_seconds
-        return timedelta(seconds=total_seconds_between_time_stamps)
+        if d1 < d2:
+            lesser_date, greater_date = d1, d2
+        else:
+            lesser_date, greater_date = d2, d1
+        lesser_date = _epoch_microseconds(lesser_date)
+        greater_date = _epoch_microseconds(greater_date)
+        config = self._config
+        return timedelta(microseconds=_business_microseconds(lesser_date, greater_date, config.start, config.end,
+                                                             config.working_mask, config.holiday_days))
+
+    def subtract_array(self, d1, d2):
+        """
+        Return an array of timedelta64 objects representing the amount of business time between each pair of
+        datetimes in two arrays. Equivalent to calling subtract on every pair, without the per day python loop.
+
+        ex.
+            >>> d1 = np.array(['2016-06-03T16:00', '2016-06-06T09:00', 'NaT'], dtype='datetime64[s]')
+            >>> d2 = np.array(['2016-06-06T09:00', '2016-06-06T10:30', '2016-06-06T10:30'], dtype='datetime64[s]')
+            >>> BusinessDatetimeCalculator().subtract_array(d1, d2)
+            array([5400000000, 5400000000,      'NaT'], dtype='timedelta64[us]')
+        :param d1: numpy array of datetime64, where NaT gives a NaT result for that pair
+        :param d2: numpy array of datetime64, where NaT gives a NaT result for that pair
+        :rtype: numpy.ndarray
+        :return:
+        """
+        if np is None:
+            raise ImportError('numpy is required for subtract_array')
+        d1 = np.asarray(d1, dtype='datetime64[us]')
+        d2 = np.asarray(d2, dtype='datetime64[us]')
+        # The busday functions raise on NaT, so count those pairs from the epoch and mask them out afterwards
+        nat = np.isnat(d1) | np.isnat(d2)
+        if nat.any():
+            d1 = np.where(nat, np.datetime64(0, 'us'), d1)
+            d2 = np.where(nat, np.datetime64(0, 'us'), d2)
+        lesser_dates = np.minimum(d1, d2)
+        greater_dates = np.maximum(d1, d2)
+        lesser_days = lesser_dates.astype('datetime64[D]')
+        greater_days = greater_dates.astype('datetime64[D]')
+        config = self._config
+        weekmask = config.weekmask
+        holidays = config.holiday_array
+        # Same counting as subtract, where the remaining and passed time only count on working days
+        lesser_working = np.is_busday(lesser_days, weekmask=weekmask, holidays=holidays)
+        greater_working = np.is_busday(greater_days, weekmask=weekmask, holidays=holidays)
+        # Working days strictly between the two dates
+        number_of_working_days = np.busday_count(lesser_days + _NP_ONE_DAY,
+                                                 np.maximum(greater_days, lesser_days + _NP_ONE_DAY),
+                                                 weekmask=weekmask, holidays=holidays)
+        no_time = np.timedelta64(0, 'us')
+        lesser_time = np.where(lesser_working, (lesser_days + config.end_td64) - lesser_dates, no_time)
+        greater_time = np.where(greater_working, greater_dates - (greater_days + config.start_td64), no_time)
+        business_time = lesser_time + greater_time + number_of_working_days * config.workday_td64
+        same_day_time = np.where(lesser_working, greater_dates - lesser_dates, no_time)
+        business_time = np.where(lesser_days == greater_days, same_day_time, business_time)
+        return np.where(nat, np.timedelta64('NaT', 'us'), business_time)
 
     def average(self, l):
         """
@@ -258,6 +838,57 @@ class BusinessDatetimeCalculator(object):
         return timedelta(seconds=sum(secs) / len(secs))
 
 
+class BusinessCalendar(object):
+    """
+    Working hours, working days and holidays applied to whole numpy arrays of timestamps at once, rather than
+    wrapping every timestamp in a BusinessDatetime.
+    ex:
+    >>> import numpy as np
+    >>> from businessdatetime import BusinessCalendar
+    >>> calendar = BusinessCalendar(working_hours=(9, 17))
+    >>> calendar.to_business(np.array(['2016-06-06T08:30', '2016-06-06T12:00'], dtype='datetime64[s]'))
+    array(['2016-06-03T16:30:00.000000', '2016-06-06T12:00:00.000000'],
+          dtype='datetime64[us]')
+
+    """
+    __slots__ = ('_config',)
+
+    holidays = _config_attribute('holidays')
+    working_hours = _config_attribute('working_hours')
+    working_days = _config_attribute('working_days')
+    weekmask = _config_attribute('weekmask')
+    seconds_in_workday = _config_attribute('seconds_in_workday')
+
+    def __init__(self, working_hours=(8.5, 17), working_days=(0, 1, 2, 3, 4), holidays=None):
+        """
+
+        :param working_hours: number representation of the start and end working hours. (8.5 = 8:30 AM)
+        :param working_days: tuple representing the days of the week which are working days. 0 = Monday, 6 = Sunday
+        :param holidays: A list of datetime objects representing holidays, which are treated like days outside of
+        working_days
+        """
+        if np is None:
+            raise ImportError('numpy is required for BusinessCalendar')
+        self._config = _get_config(working_hours, working_days, holidays)
+
+    def __reduce__(self):
+        return self.__class__, (self.working_hours, self.working_days, self.holidays)
+
+    def to_business(self, dts):
+        """
+        Return an array of the business datetimes for an array of timestamps. Equal to the business_datetime of
+        a BusinessDatetime built from every timestamp.
+        :param dts: numpy array of datetime64
+        :rtype: numpy.ndarray
+        :return:
+        """
+        config = self._config
+        dts = np.asarray(dts, dtype='datetime64[us]')
+        days = dts.astype('datetime64[D]')
+        business_dts = np.where(dts < days + config.start_td64, _rollback_array(dts, days, config), dts)
+        return np.where(dts > days + config.end_td64, _rollforward_array(dts, days, config), business_dts)
+
+
 def usage_examples():
     dt = datetime(2016, 6, 6, 8, 30)
     bdt = BusinessDatetime(dt)
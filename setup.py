@@ -5,6 +5,11 @@ version = '0.0.2'
 
 REQUIREMENTS = []
 
+EXTRAS_REQUIRE = {
+    'numpy': ['numpy'],
+    'numba': ['numba'],
+}
+
 CLASSIFIERS = [
     'Development Status :: 2 - Pre-Alpha',
     'Environment :: Web Environment',
@@ -27,10 +32,11 @@ setup(
     author="Mark Sanders",
     author_email="sdscdeveloper@gmail.com",
     url="http://github.com/ziplokk/BusinessDatetime",
-    packages=find_packages(),
+    packages=find_packages(exclude=['tests']),
     platforms=['OS Independent'],
     license='LICENSE.txt',
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIRE,
     classifiers=CLASSIFIERS,
     include_package_data=True,
     zip_safe=False
@@ -0,0 +1,275 @@
+import pickle
+import unittest
+from datetime import datetime, timedelta, tzinfo
+from random import Random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import businessdatetime
+from businessdatetime import BusinessCalendar, BusinessDatetime, BusinessDatetimeCalculator
+
+
+class FixedOffset(tzinfo):
+    def __init__(self, hours):
+        self._offset = timedelta(hours=hours)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def tzname(self, dt):
+        return None
+
+    def dst(self, dt):
+        return timedelta(0)
+
+
+class TestOffsetAwareDatetimes(unittest.TestCase):
+
+    def setUp(self):
+        self.utc = datetime(2016, 6, 6, 12, tzinfo=FixedOffset(0))
+        self.est = datetime(2016, 6, 6, 12, tzinfo=FixedOffset(-5))
+
+    def test_subtract_rejects_aware_datetimes(self):
+        self.assertRaises(TypeError, BusinessDatetimeCalculator().subtract, self.utc, self.est)
+
+    def test_calc_diff_rejects_aware_datetimes(self):
+        self.assertRaises(TypeError, lambda: BusinessDatetime(self.utc) - BusinessDatetime(self.est))
+
+    def test_roll_rejects_aware_datetimes(self):
+        self.assertRaises(TypeError, BusinessDatetime(self.utc).rollforward)
+        self.assertRaises(TypeError, BusinessDatetime(self.utc).rollback)
+
+
+class TestWorkingDays(unittest.TestCase):
+
+    def test_rejects_empty_working_days(self):
+        self.assertRaises(ValueError, BusinessDatetime, datetime(2016, 6, 6), working_days=())
+
+    def test_rejects_out_of_range_weekdays(self):
+        self.assertRaises(ValueError, BusinessDatetime, datetime(2016, 6, 6), working_days=(7,))
+        self.assertRaises(ValueError, BusinessDatetime, datetime(2016, 6, 6), working_days=(0, -1))
+        self.assertRaises(ValueError, BusinessDatetimeCalculator, working_days=(0, 1.5))
+
+    def test_next_and_previous_business_day(self):
+        bdt = BusinessDatetime(datetime(2016, 6, 3, 12), working_hours=(9, 17), working_days=(0, 2, 4))
+        self.assertEqual(bdt.next_business_day_start, datetime(2016, 6, 6, 9))
+        self.assertEqual(bdt.previous_business_day_end, datetime(2016, 6, 1, 17))
+
+
+class TestConfigCache(unittest.TestCase):
+
+    def test_shares_config_for_the_same_holidays(self):
+        holidays = [datetime(2016, 6, 8)]
+        a = BusinessDatetime(datetime(2016, 6, 6, 12), holidays=holidays)
+        b = BusinessDatetime(datetime(2016, 6, 13, 9), holidays=holidays)
+        self.assertTrue(a._config is b._config)
+        self.assertEqual(b - a, timedelta(hours=31))
+
+    def test_shares_config_for_equal_holiday_lists(self):
+        a = BusinessDatetime(datetime(2016, 6, 6, 12), holidays=[datetime(2016, 6, 8)])
+        b = BusinessDatetime(datetime(2016, 6, 13, 9), holidays=[datetime(2016, 6, 8)])
+        self.assertTrue(a._config is b._config)
+        self.assertEqual(b - a, timedelta(hours=31))
+
+    def test_notices_changed_holidays(self):
+        holidays = []
+        a = BusinessDatetime(datetime(2016, 6, 6, 12), holidays=holidays)
+        b = BusinessDatetime(datetime(2016, 6, 13, 9), holidays=holidays)
+        self.assertEqual(b - a, timedelta(hours=39, minutes=30))
+        holidays.append(datetime(2016, 6, 8))
+        b = BusinessDatetime(datetime(2016, 6, 13, 9), holidays=holidays)
+        self.assertEqual(b - a, timedelta(hours=31))
+        self.assertEqual(a.holidays, [])
+
+    def test_subtracting_a_datetime_keeps_the_configuration(self):
+        bdt = BusinessDatetime(datetime(2016, 6, 6, 12), working_hours=(9, 17))
+        self.assertEqual(bdt - datetime(2016, 6, 6, 8), timedelta(hours=4))
+        self.assertEqual((bdt - timedelta(hours=4)).working_hours, (9, 17))
+
+    def test_bounds_specialized_classes(self):
+        holidays = [[datetime(2016, 6, 8) + timedelta(days=i)] for i in range(2 * businessdatetime._CONFIG_CACHE_SIZE)]
+        for h in holidays:
+            BusinessDatetime.specialize(holidays=h)
+        self.assertTrue(len(businessdatetime._specialized_classes) <= businessdatetime._CONFIG_CACHE_SIZE)
+        self.assertTrue(BusinessDatetime.specialize(holidays=holidays[-1]) is
+                        BusinessDatetime.specialize(holidays=holidays[-1]))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_accepts_datetime64_holidays(self):
+        holidays = np.array(['2016-06-08', 'NaT'], dtype='datetime64[D]')
+        calculator = BusinessDatetimeCalculator(holidays=holidays)
+        self.assertEqual(calculator.subtract(datetime(2016, 6, 7, 12), datetime(2016, 6, 9, 12)),
+                         timedelta(hours=8, minutes=30))
+
+
+class TestSpecialize(unittest.TestCase):
+
+    def test_subtracting_a_timedelta_keeps_the_class(self):
+        specialized = BusinessDatetime.specialize(working_hours=(9, 17))
+        bdt = specialized(datetime(2016, 6, 6, 12)) - timedelta(hours=1)
+        self.assertTrue(type(bdt) is specialized)
+        self.assertEqual(bdt.business_datetime, datetime(2016, 6, 6, 11))
+
+    def test_matches_business_datetime(self):
+        random = Random(13)
+        holidays = [datetime(2016, 6, 1) + timedelta(days=random.randint(0, 40)) for _ in range(8)]
+        for working_days in [(0, 1, 2, 3, 4), (0, 2, 5), (6,)]:
+            for h in [None, holidays]:
+                kwargs = dict(working_hours=(8.5, 17.25), working_days=working_days, holidays=h)
+                specialized = BusinessDatetime.specialize(**kwargs)
+                for _ in range(200):
+                    x = datetime(2016, 6, 1) + timedelta(seconds=random.randint(0, 40 * 86400),
+                                                         microseconds=random.randint(0, 999999))
+                    y = x + timedelta(seconds=random.randint(-10 * 86400, 10 * 86400))
+                    a, b = BusinessDatetime(x, **kwargs), BusinessDatetime(y, **kwargs)
+                    c, d = specialized(x), specialized(y)
+                    self.assertEqual(c.business_datetime, a.business_datetime)
+                    self.assertEqual(c.next_business_day_start, a.next_business_day_start)
+                    self.assertEqual(c.previous_business_day_end, a.previous_business_day_end)
+                    self.assertEqual(d - c, b - a)
+                    self.assertEqual(c - d, a - b)
+
+
+class TestHolidays(unittest.TestCase):
+
+    def setUp(self):
+        # Monday
+        self.holidays = [datetime(2016, 6, 6)]
+
+    def test_rollforward_skips_holidays(self):
+        bdt = BusinessDatetime(datetime(2016, 6, 3, 17, 30), holidays=self.holidays)
+        self.assertEqual(bdt.business_datetime, datetime(2016, 6, 7, 9))
+
+    def test_rollback_skips_holidays(self):
+        bdt = BusinessDatetime(datetime(2016, 6, 7, 8), holidays=self.holidays)
+        self.assertEqual(bdt.business_datetime, datetime(2016, 6, 3, 16, 30))
+
+    def test_rolls_skip_consecutive_holidays(self):
+        holidays = [datetime(2016, 6, 6), datetime(2016, 6, 7)]
+        bdt = BusinessDatetime(datetime(2016, 6, 3, 18), holidays=holidays)
+        self.assertEqual(bdt.next_business_day_start, datetime(2016, 6, 8, 8, 30))
+        bdt = BusinessDatetime(datetime(2016, 6, 8, 7), holidays=holidays)
+        self.assertEqual(bdt.previous_business_day_end, datetime(2016, 6, 3, 17))
+
+    def test_specialized_rolls_skip_holidays(self):
+        cls = BusinessDatetime.specialize(holidays=self.holidays)
+        self.assertEqual(cls(datetime(2016, 6, 3, 17, 30)).business_datetime, datetime(2016, 6, 7, 9))
+        self.assertEqual(cls(datetime(2016, 6, 7, 9)) - cls(datetime(2016, 6, 3, 17, 30)), timedelta(0))
+
+    def test_subtract_from_a_holiday(self):
+        calculator = BusinessDatetimeCalculator(holidays=self.holidays)
+        self.assertEqual(calculator.subtract(datetime(2016, 6, 6, 10), datetime(2016, 6, 7, 10)),
+                         timedelta(hours=1, minutes=30))
+        self.assertEqual(calculator.subtract(datetime(2016, 6, 6, 10), datetime(2016, 6, 6, 12)), timedelta(0))
+
+    def test_subtract_from_a_weekend(self):
+        calculator = BusinessDatetimeCalculator()
+        self.assertEqual(calculator.subtract(datetime(2016, 6, 3, 16), datetime(2016, 6, 4, 10)), timedelta(hours=1))
+
+    def test_calc_diff_over_a_holiday(self):
+        lesser = BusinessDatetime(datetime(2016, 6, 3, 16), holidays=self.holidays)
+        greater = BusinessDatetime(datetime(2016, 6, 7, 10), holidays=self.holidays)
+        self.assertEqual(greater - lesser, timedelta(hours=2, minutes=30))
+        self.assertEqual(lesser - greater, -timedelta(hours=2, minutes=30))
+
+    def test_subtract_matches_counting_day_by_day(self):
+        random = Random(5)
+        holidays = [datetime(2016, 6, 1) + timedelta(days=random.randint(0, 40)) for _ in range(8)]
+        calculator = BusinessDatetimeCalculator(holidays=holidays)
+        holiday_dates = set(d.date() for d in holidays)
+        for _ in range(500):
+            dates = []
+            for _ in range(2):
+                day = datetime(2016, 6, 1) + timedelta(days=random.randint(0, 40))
+                dates.append(day + timedelta(minutes=random.randint(8 * 60 + 30, 17 * 60)))
+            lesser, greater = min(dates), max(dates)
+            expected = timedelta(0)
+            day = lesser.replace(hour=0, minute=0)
+            while day <= greater:
+                if day.weekday() < 5 and day.date() not in holiday_dates:
+                    expected += min(greater, day + timedelta(hours=17)) - max(lesser, day + timedelta(hours=8.5))
+                day += timedelta(days=1)
+            self.assertEqual(calculator.subtract(lesser, greater), expected)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_array_rolls_skip_holidays(self):
+        self.assertEqual(BusinessDatetime.rollforward_array(np.array(['2016-06-03T17:30'], dtype='datetime64[us]'),
+                                                            holidays=self.holidays)[0],
+                         np.datetime64('2016-06-07T09:00', 'us'))
+        self.assertEqual(BusinessDatetime.rollback_array(np.array(['2016-06-07T08:00'], dtype='datetime64[us]'),
+                                                         holidays=self.holidays)[0],
+                         np.datetime64('2016-06-03T16:30', 'us'))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_calendar_matches_business_datetime(self):
+        random = Random(15)
+        holidays = [datetime(2016, 6, 1) + timedelta(days=random.randint(0, 40)) for _ in range(8)]
+        calendar = BusinessCalendar(working_hours=(9, 17.5), working_days=(0, 2, 3, 4), holidays=holidays)
+        dts = [datetime(2016, 6, 1) + timedelta(minutes=random.randint(0, 40 * 24 * 60)) for _ in range(500)]
+        business_dts = calendar.to_business(np.array(dts, dtype='datetime64[us]'))
+        for dt, business_dt in zip(dts, business_dts.tolist()):
+            bdt = BusinessDatetime(dt, working_hours=(9, 17.5), working_days=(0, 2, 3, 4), holidays=holidays)
+            self.assertEqual(business_dt, bdt.business_datetime)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestSubtractArray(unittest.TestCase):
+
+    def test_matches_subtract(self):
+        random = Random(1)
+        holidays = [datetime(2016, 6, 1) + timedelta(days=random.randint(0, 40)) for _ in range(8)]
+        for working_days in [(0, 1, 2, 3, 4), (0, 2, 5), (6,)]:
+            calculator = BusinessDatetimeCalculator(working_hours=(8.5, 17.25), working_days=working_days,
+                                                    holidays=holidays)
+            d1 = [datetime(2016, 6, 1) + timedelta(seconds=random.randint(0, 40 * 86400),
+                                                   microseconds=random.randint(0, 999999)) for _ in range(500)]
+            d2 = [d + timedelta(seconds=random.randint(-10 * 86400, 10 * 86400)) for d in d1]
+            business_times = calculator.subtract_array(np.array(d1, dtype='datetime64[us]'),
+                                                       np.array(d2, dtype='datetime64[us]'))
+            for a, b, business_time in zip(d1, d2, business_times.tolist()):
+                self.assertEqual(business_time, calculator.subtract(a, b))
+
+    def test_nat_gives_nat(self):
+        d1 = np.array(['2016-06-03T16:00', 'NaT'], dtype='datetime64[s]')
+        d2 = np.array(['2016-06-06T09:00', '2016-06-06T10:30'], dtype='datetime64[s]')
+        business_times = BusinessDatetimeCalculator().subtract_array(d1, d2)
+        self.assertEqual(business_times[0], np.timedelta64(90, 'm'))
+        self.assertTrue(np.isnat(business_times[1]))
+
+
+class TestPickle(unittest.TestCase):
+
+    def round_trip(self, obj):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            yield pickle.loads(pickle.dumps(obj, protocol))
+
+    def test_business_datetime(self):
+        bdt = BusinessDatetime(datetime(2016, 6, 6, 8), working_hours=(9, 17), holidays=[datetime(2016, 6, 8)])
+        for copy in self.round_trip(bdt):
+            self.assertEqual(copy.original_datetime, bdt.original_datetime)
+            self.assertEqual(copy.business_datetime, datetime(2016, 6, 3, 16))
+            self.assertEqual(copy.holidays, [datetime(2016, 6, 8)])
+
+    def test_specialized_business_datetime(self):
+        specialized = BusinessDatetime.specialize(working_hours=(9, 17))
+        bdt = specialized(datetime(2016, 6, 6, 8))
+        for copy in self.round_trip(bdt):
+            self.assertTrue(type(copy) is specialized)
+            self.assertEqual(copy.business_datetime, datetime(2016, 6, 3, 16))
+
+    def test_calculator(self):
+        calculator = BusinessDatetimeCalculator(working_hours=(9, 17), working_days=(0, 1, 2))
+        for copy in self.round_trip(calculator):
+            self.assertEqual((copy.working_hours, copy.working_days), ((9, 17), (0, 1, 2)))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_calendar(self):
+        for copy in self.round_trip(BusinessCalendar(working_hours=(9, 17))):
+            self.assertEqual(copy.working_hours, (9, 17))
+
+
+if __name__ == '__main__':
+    unittest.main()